@@ -0,0 +1,31 @@
+"""
+Background event loop for running async ADK calls from synchronous Bolt listeners.
+
+A single event loop runs forever in a daemon thread, so HTTP clients used by
+LiteLLM keep their connection pools warm across Slack requests instead of
+being torn down with a per-request loop.
+"""
+
+import asyncio
+import concurrent.futures
+import threading
+from typing import Any, Coroutine, TypeVar
+
+T = TypeVar("T")
+
+_loop = asyncio.new_event_loop()
+_thread = threading.Thread(target=_loop.run_forever, name="adk-event-loop", daemon=True)
+_thread.start()
+
+
+def submit(coro: Coroutine[Any, Any, T]) -> "concurrent.futures.Future[T]":
+    """
+    Schedule a coroutine on the background event loop.
+
+    Args:
+        coro: The coroutine to run
+
+    Returns:
+        concurrent.futures.Future: Future that resolves with the coroutine's result
+    """
+    return asyncio.run_coroutine_threadsafe(coro, _loop)
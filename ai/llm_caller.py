@@ -5,14 +5,32 @@ This module provides the interface for calling the ADK multi-agent system
 and streaming responses back to Slack.
 """
 
+import asyncio
+import functools
 import logging
-from typing import Dict, List, AsyncGenerator, Literal
-
-from google.adk.runners import InMemoryRunner
-from google.genai import types
+import re
+import time
+from collections import OrderedDict
+from typing import (
+    TYPE_CHECKING,
+    Dict,
+    List,
+    AsyncGenerator,
+    Literal,
+    Optional,
+    Set,
+    Tuple,
+)
 
 from .agents import get_root_agent
 
+if TYPE_CHECKING:
+    from google.adk.agents import Agent
+    from google.adk.artifacts import InMemoryArtifactService
+    from google.adk.memory import InMemoryMemoryService
+    from google.adk.runners import Runner
+    from google.adk.sessions import InMemorySessionService
+
 logger = logging.getLogger(__name__)
 
 
@@ -24,18 +42,158 @@ class LLMEvent(Dict):
     text: str
 
 
-# Initialize the ADK runner with the root agent
-_runner = None
+# Longest stretch of streaming (in seconds) before explicitly yielding to the event loop
+_LOOP_YIELD_INTERVAL = 0.005
+
+# Separator between independent sub-queries of a compound request
+_COMPOUND_QUERY_SPLIT_RE = re.compile(r"\s+and\s+", re.IGNORECASE)
+
+# One ADK runner per agent, keyed by agent name. Agents are module-level
+# singletons, so the name identifies everything that affects behavior.
+_runners: Dict[str, "Runner"] = {}
 _app_name = "slack_ai_agent"
 
+# Routing cache: normalized user query -> name of the sub-agent the coordinator
+# transferred to. On a hit the coordinator round-trip is skipped entirely.
+# Least recently used routes are evicted once the cache is full.
+_ROUTE_CACHE_MAXSIZE = 1024
+_route_cache: "OrderedDict[str, str]" = OrderedDict()
+
+# Sessions already created, keyed by (user ID, session ID)
+_known_sessions: Set[Tuple[str, str]] = set()
+
+
+@functools.lru_cache(maxsize=None)
+def _get_shared_services() -> Tuple[
+    "InMemorySessionService", "InMemoryArtifactService", "InMemoryMemoryService"
+]:
+    """
+    Get the in-memory services shared by every runner.
+
+    Sharing the session service lets the coordinator and directly-routed
+    sub-agents see the same conversation history for a thread.
+    """
+    from google.adk.artifacts import InMemoryArtifactService
+    from google.adk.memory import InMemoryMemoryService
+    from google.adk.sessions import InMemorySessionService
+
+    return InMemorySessionService(), InMemoryArtifactService(), InMemoryMemoryService()
+
+
+def get_runner_for(agent: "Agent") -> "Runner":
+    """Get or create the ADK Runner that runs the given agent."""
+    runner = _runners.get(agent.name)
+    if runner is None:
+        from google.adk.runners import Runner
+
+        session_service, artifact_service, memory_service = _get_shared_services()
+        runner = Runner(
+            agent=agent,
+            app_name=_app_name,
+            session_service=session_service,
+            artifact_service=artifact_service,
+            memory_service=memory_service,
+        )
+        _runners[agent.name] = runner
+    return runner
+
+
+def get_adk_runner() -> "Runner":
+    """Get or create the ADK Runner for the root coordinator agent."""
+    return get_runner_for(get_root_agent())
+
+
+def warm_up_runners() -> None:
+    """
+    Create runners for the coordinator and every sub-agent ahead of the first request.
+
+    Call this once at process startup so the first Slack user doesn't pay for
+    runner construction and model client setup.
+    """
+    root_agent = get_root_agent()
+    get_runner_for(root_agent)
+    for sub_agent in root_agent.sub_agents:
+        get_runner_for(sub_agent)
+
+
+def clear_runner_cache() -> None:
+    """Drop all cached runners, along with their in-memory sessions."""
+    _runners.clear()
+    _get_shared_services.cache_clear()
+    _known_sessions.clear()
 
-def get_adk_runner() -> InMemoryRunner:
-    """Get or create the ADK InMemoryRunner instance."""
-    global _runner
-    if _runner is None:
-        root_agent = get_root_agent()
-        _runner = InMemoryRunner(agent=root_agent, app_name=_app_name)
-    return _runner
+
+def normalize_query(query: str) -> str:
+    """Normalize a user query into a routing cache key."""
+    return " ".join(query.lower().split())
+
+
+def clear_route_cache() -> None:
+    """Forget all cached routing decisions."""
+    _route_cache.clear()
+
+
+def _route_cache_lookup(route_key: str) -> Optional["Agent"]:
+    """Return the sub-agent previously chosen for this query, if any."""
+    agent_name = _route_cache.get(route_key)
+    if agent_name is None:
+        return None
+    _route_cache.move_to_end(route_key)
+    return get_root_agent().find_agent(agent_name)
+
+
+def _record_route(route_key: str, agent_name: str) -> None:
+    """Remember which sub-agent handled a query, evicting the oldest route if full."""
+    _route_cache[route_key] = agent_name
+    _route_cache.move_to_end(route_key)
+    if len(_route_cache) > _ROUTE_CACHE_MAXSIZE:
+        _route_cache.popitem(last=False)
+
+
+async def _ensure_session(user_id: str, session_id: str) -> bool:
+    """
+    Make sure the ADK session for a thread exists.
+
+    Returns:
+        bool: True if the session was created by this call, i.e. this is its first turn.
+    """
+    if (user_id, session_id) in _known_sessions:
+        return False
+    session_service = _get_shared_services()[0]
+    session = await session_service.get_session(
+        app_name=_app_name, user_id=user_id, session_id=session_id
+    )
+    if session is None:
+        await session_service.create_session(
+            app_name=_app_name, user_id=user_id, session_id=session_id
+        )
+    # Only remembered once the session is confirmed, so failures are retried
+    _known_sessions.add((user_id, session_id))
+    return session is None
+
+
+def _plan_parallel_routes(query: str) -> List[Tuple[str, "Agent"]]:
+    """
+    Split a compound query into independent sub-queries that can run concurrently.
+
+    Only splits when every part already has a cached route and each part goes to
+    a different sub-agent, which keeps ordinary sentences containing "and" intact.
+
+    Returns:
+        List of (sub-query, agent) pairs, empty if the query should not be split.
+    """
+    parts = _COMPOUND_QUERY_SPLIT_RE.split(query.strip())
+    if len(parts) < 2:
+        return []
+    routes = []
+    for part in parts:
+        agent = _route_cache_lookup(normalize_query(part))
+        if agent is None:
+            return []
+        routes.append((part, agent))
+    if len({agent.name for _, agent in routes}) < len(routes):
+        return []
+    return routes
 
 
 async def call_llm(
@@ -56,21 +214,6 @@ async def call_llm(
             - status events: Updates about what the agent is doing (tool calls, agent transfers)
             - content events: Actual response text to display to the user
     """
-    runner = get_adk_runner()
-
-    # Create or get session
-    if session_id is None:
-        session_id = f"session_{user_id}"
-
-    # Ensure session exists
-    try:
-        await runner.session_service.create_session(
-            app_name=_app_name, user_id=user_id, session_id=session_id
-        )
-    except Exception:
-        # Session might already exist, which is fine
-        pass
-
     # Convert messages to ADK format - only send the last user message
     last_message = (
         messages_in_thread[-1]
@@ -78,28 +221,91 @@ async def call_llm(
         else {"role": "user", "content": ""}
     )
 
+    # Create or get session
+    if session_id is None:
+        session_id = f"session_{user_id}"
+    is_first_turn = await _ensure_session(user_id, session_id)
+
+    # Skip the coordinator when we already know which sub-agent handles this query
+    route_key = normalize_query(last_message["content"])
+    routed_agent = _route_cache_lookup(route_key)
+    if routed_agent is not None:
+        logger.info(f"Routing cache hit, dispatching directly to {routed_agent.name}")
+    else:
+        # Independent sub-queries with known routes are answered concurrently
+        parallel_routes = _plan_parallel_routes(last_message["content"])
+        if parallel_routes:
+            logger.info(
+                "Running sub-queries in parallel on "
+                + ", ".join(agent.name for _, agent in parallel_routes)
+            )
+            async for event in _run_agents_in_parallel(
+                parallel_routes, user_id, session_id
+            ):
+                yield event
+            return
+    agent = routed_agent or get_root_agent()
+
+    # Follow-ups like "yes" depend on the thread, so only first turns are cached
+    async for event in _run_agent(
+        agent,
+        last_message["content"],
+        user_id,
+        session_id,
+        route_key if is_first_turn else None,
+    ):
+        yield event
+
+
+async def _run_agent(
+    agent: "Agent",
+    query: str,
+    user_id: str,
+    session_id: str,
+    route_key: Optional[str] = None,
+) -> AsyncGenerator[Dict[str, str], None]:
+    """
+    Run a single ADK agent on a query and stream status and content events.
+
+    Args:
+        agent: The agent to run, either the coordinator or a sub-agent
+        query: The user message to send to the agent
+        user_id: The Slack user ID
+        session_id: Session ID of an existing session for this thread
+        route_key: Routing cache key to record coordinator transfers under
+
+    Yields:
+        Dict[str, str]: Events with 'type' (either 'status' or 'content') and 'text' keys
+    """
+    runner = get_runner_for(agent)
+
+    from google.genai import types
+
     # Create the message content
-    new_message = types.Content(
-        role="user", parts=[types.Part(text=last_message["content"])]
-    )
+    new_message = types.Content(role="user", parts=[types.Part(text=query)])
 
     # Track the current agent for status updates
     current_agent = None
     has_started_streaming_content = False
+    last_loop_yield = time.monotonic()
 
     # Use the runner's run_async method for streaming
     async for event in runner.run_async(
         user_id=user_id, session_id=session_id, new_message=new_message
     ):
-        # Log the full event for debugging
-        logger.info(
-            f"ADK Event - Author: {event.author}, Has content: {bool(event.content)}"
+        # Read each event attribute once per event
+        author = event.author
+        content = event.content
+        actions = getattr(event, "actions", None)
+
+        # Lazy %-style args keep per-event logging cheap when DEBUG is disabled
+        logger.debug(
+            "ADK Event - Author: %s, Has content: %s", author, content is not None
         )
-        logger.info(f"Event attributes: {dir(event)}")
 
         # Detect agent changes/transfers
-        if event.author and event.author != "user" and event.author != current_agent:
-            current_agent = event.author
+        if author and author != "user" and author != current_agent:
+            current_agent = author
             # Only show agent status before we start streaming actual content
             if not has_started_streaming_content:
                 status_text = f"{current_agent} is working..."
@@ -107,15 +313,12 @@ async def call_llm(
                 yield {"type": "status", "text": status_text}
 
         # Detect tool calls (function calls)
-        function_calls = (
-            event.get_function_calls() if hasattr(event, "get_function_calls") else []
-        )
-        logger.info(f"Function calls detected: {len(function_calls)}")
+        get_function_calls = getattr(event, "get_function_calls", None)
+        function_calls = get_function_calls() if get_function_calls else ()
+        logger.debug("Function calls detected: %d", len(function_calls))
         if function_calls and not has_started_streaming_content:
             for func_call in function_calls:
-                tool_name = (
-                    func_call.name if hasattr(func_call, "name") else str(func_call)
-                )
+                tool_name = getattr(func_call, "name", None) or str(func_call)
                 # Make tool names more readable
                 readable_name = tool_name.replace("_", " ").title()
                 status_text = f"Using {readable_name}..."
@@ -123,21 +326,79 @@ async def call_llm(
                 yield {"type": "status", "text": status_text}
 
         # Detect agent transfers
-        if hasattr(event, "actions") and event.actions:
-            logger.info(f"Event has actions: {event.actions}")
-            if (
-                hasattr(event.actions, "transfer_to_agent")
-                and event.actions.transfer_to_agent
-            ):
-                target_agent = event.actions.transfer_to_agent
+        if actions:
+            logger.debug("Event has actions: %s", actions)
+            target_agent = getattr(actions, "transfer_to_agent", None)
+            if target_agent:
+                if route_key:
+                    _record_route(route_key, target_agent)
                 status_text = f"Consulting {target_agent}..."
                 logger.info(f"Yielding transfer status: {status_text}")
                 yield {"type": "status", "text": status_text}
 
         # Stream all non-user content events
-        if event.content and event.content.parts and event.author != "user":
+        if content and content.parts and author != "user":
             # Extract text from all parts and yield as content
-            for part in event.content.parts:
-                if hasattr(part, "text") and part.text:
+            for part in content.parts:
+                text = getattr(part, "text", None)
+                if text:
+                    has_started_streaming_content = True
+                    yield {"type": "content", "text": text}
+
+        # ADK can deliver bursts of events without suspending; give other
+        # coroutines on the shared event loop a turn during long responses
+        now = time.monotonic()
+        if now - last_loop_yield > _LOOP_YIELD_INTERVAL:
+            await asyncio.sleep(0)
+            last_loop_yield = now
+
+
+async def _run_agents_in_parallel(
+    routes: List[Tuple[str, "Agent"]],
+    user_id: str,
+    session_id: str,
+) -> AsyncGenerator[Dict[str, str], None]:
+    """
+    Run independent sub-queries concurrently and stream their output in query order.
+
+    Every agent starts right away. Output of the first sub-query is streamed live
+    while the others are buffered until it is their turn.
+
+    Args:
+        routes: Sub-queries paired with the agent that handles each of them
+        user_id: The Slack user ID
+        session_id: Session ID for maintaining conversation context
+
+    Yields:
+        Dict[str, str]: Events with 'type' (either 'status' or 'content') and 'text' keys
+    """
+    queues: List[asyncio.Queue] = [asyncio.Queue() for _ in routes]
+
+    async def pump(agent: "Agent", query: str, queue: asyncio.Queue):
+        try:
+            async for event in _run_agent(agent, query, user_id, session_id):
+                await queue.put(event)
+        finally:
+            await queue.put(None)
+
+    tasks = [
+        asyncio.create_task(pump(agent, query, queue))
+        for (query, agent), queue in zip(routes, queues)
+    ]
+    has_started_streaming_content = False
+    try:
+        for i, queue in enumerate(queues):
+            if i > 0 and has_started_streaming_content:
+                yield {"type": "content", "text": "\n\n"}
+            while (event := await queue.get()) is not None:
+                if event["type"] == "content":
                     has_started_streaming_content = True
-                    yield {"type": "content", "text": part.text}
+                elif has_started_streaming_content:
+                    # Status updates only make sense before the answer starts
+                    continue
+                yield event
+        # Surface any error raised by one of the agents
+        await asyncio.gather(*tasks)
+    finally:
+        for task in tasks:
+            task.cancel()
@@ -4,8 +4,79 @@ Custom tools for ADK agents.
 This module contains various tools that agents can use to perform specific tasks.
 """
 
+import ast
 import datetime
-from typing import Dict, Any
+import functools
+import operator
+import re
+from typing import Any, Callable, Dict, Union
+
+# Only numbers, basic operators, parentheses, dots and spaces are allowed in calculate()
+_SAFE_EXPR_RE = re.compile(r"[0-9+\-*/(). ]*")
+
+# Upper bound on the size (in bits) of an integer power calculate() will compute,
+# estimated as exponent * bit length of the base
+_MAX_POWER_BITS = 10_000
+
+
+def _safe_pow(
+    base: Union[int, float], exponent: Union[int, float]
+) -> Union[int, float]:
+    """Raise base to exponent, refusing integer powers too large to compute quickly."""
+    if (
+        isinstance(base, int)
+        and isinstance(exponent, int)
+        and abs(base) > 1
+        and exponent * base.bit_length() > _MAX_POWER_BITS
+    ):
+        raise ValueError("Result is too large")
+    return operator.pow(base, exponent)
+
+
+_BINARY_OPERATORS = {
+    ast.Add: operator.add,
+    ast.Sub: operator.sub,
+    ast.Mult: operator.mul,
+    ast.Div: operator.truediv,
+    ast.FloorDiv: operator.floordiv,
+    ast.Mod: operator.mod,
+    ast.Pow: _safe_pow,
+}
+_UNARY_OPERATORS = {
+    ast.UAdd: operator.pos,
+    ast.USub: operator.neg,
+}
+_ALLOWED_NODES = (
+    ast.Expression,
+    ast.BinOp,
+    ast.UnaryOp,
+    ast.Constant,
+    *_BINARY_OPERATORS,
+    *_UNARY_OPERATORS,
+)
+
+
+@functools.lru_cache(maxsize=1024)
+def _parse_expression(expression: str) -> ast.Expression:
+    """Parse an arithmetic expression, rejecting anything but numbers and operators."""
+    tree = ast.parse(expression.strip(), mode="eval")
+    for node in ast.walk(tree):
+        if not isinstance(node, _ALLOWED_NODES):
+            raise ValueError(f"Unsupported syntax: {type(node).__name__}")
+        if isinstance(node, ast.Constant) and type(node.value) not in (int, float):
+            raise ValueError(f"Unsupported constant: {node.value!r}")
+    return tree
+
+
+def _eval_node(node: ast.AST) -> Union[int, float]:
+    """Evaluate a node of a tree returned by _parse_expression."""
+    if isinstance(node, ast.Constant):
+        return node.value
+    if isinstance(node, ast.BinOp):
+        return _BINARY_OPERATORS[type(node.op)](
+            _eval_node(node.left), _eval_node(node.right)
+        )
+    return _UNARY_OPERATORS[type(node.op)](_eval_node(node.operand))
 
 
 def get_current_time() -> Dict[str, str]:
@@ -15,14 +86,12 @@ def get_current_time() -> Dict[str, str]:
     Returns:
         dict: A dictionary containing the current date and time information.
     """
-    now = datetime.datetime.now()
+    now = datetime.datetime.now().astimezone()
     return {
         "status": "success",
         "current_time": now.strftime("%Y-%m-%d %H:%M:%S"),
         "day_of_week": now.strftime("%A"),
-        "timezone": "UTC"
-        if datetime.datetime.now().tzinfo is None
-        else str(datetime.datetime.now().tzinfo),
+        "timezone": str(now.tzinfo) if now.tzinfo else "UTC",
     }
 
 
@@ -38,19 +107,26 @@ def calculate(expression: str) -> Dict[str, Any]:
     """
     try:
         # Only allow safe mathematical operations
-        allowed_chars = set("0123456789+-*/().  ")
-        if not all(c in allowed_chars for c in expression):
+        if not _SAFE_EXPR_RE.fullmatch(expression):
             return {
                 "status": "error",
                 "message": "Invalid characters in expression. Only numbers and basic operators (+, -, *, /, parentheses) are allowed.",
             }
 
-        result = eval(expression, {"__builtins__": {}}, {})
+        result = _eval_node(_parse_expression(expression).body)
         return {"status": "success", "expression": expression, "result": result}
     except Exception as e:
         return {"status": "error", "message": f"Error evaluating expression: {str(e)}"}
 
 
+_TEXT_FORMATTERS: Dict[str, Callable[[str], str]] = {
+    "uppercase": str.upper,
+    "lowercase": str.lower,
+    "title": str.title,
+    "reverse": lambda text: text[::-1],
+}
+
+
 def format_text(text: str, format_type: str = "uppercase") -> Dict[str, str]:
     """
     Format text in various ways.
@@ -65,16 +141,8 @@ def format_text(text: str, format_type: str = "uppercase") -> Dict[str, str]:
         dict: A dictionary containing the formatted text.
     """
     format_type = format_type.lower()
-
-    if format_type == "uppercase":
-        formatted = text.upper()
-    elif format_type == "lowercase":
-        formatted = text.lower()
-    elif format_type == "title":
-        formatted = text.title()
-    elif format_type == "reverse":
-        formatted = text[::-1]
-    else:
+    formatter = _TEXT_FORMATTERS.get(format_type)
+    if formatter is None:
         return {
             "status": "error",
             "message": f"Unknown format type: {format_type}. Use 'uppercase', 'lowercase', 'title', or 'reverse'.",
@@ -83,7 +151,7 @@ def format_text(text: str, format_type: str = "uppercase") -> Dict[str, str]:
     return {
         "status": "success",
         "original": text,
-        "formatted": formatted,
+        "formatted": formatter(text),
         "format_type": format_type,
     }
 
@@ -105,7 +173,7 @@ def count_words(text: str) -> Dict[str, Any]:
         "status": "success",
         "word_count": len(words),
         "character_count": len(text),
-        "character_count_no_spaces": len(text.replace(" ", "")),
+        "character_count_no_spaces": len(text) - text.count(" "),
         "sentence_count": sentences if sentences > 0 else 1,
     }
 
@@ -121,9 +189,10 @@ def create_list(items: str, separator: str = ",") -> Dict[str, Any]:
     Returns:
         dict: A dictionary containing the formatted list.
     """
-    item_list = [item.strip() for item in items.split(separator) if item.strip()]
+    stripped_items = (item.strip() for item in items.split(separator))
+    item_list = [item for item in stripped_items if item]
 
-    formatted_list = "\n".join([f"{i + 1}. {item}" for i, item in enumerate(item_list)])
+    formatted_list = "\n".join(f"{i}. {item}" for i, item in enumerate(item_list, 1))
 
     return {
         "status": "success",
@@ -133,6 +202,19 @@ def create_list(items: str, separator: str = ",") -> Dict[str, Any]:
     }
 
 
+_HELP_INFO = {
+    "status": "success",
+    "message": "I have access to several tools",
+    "available_tools": (
+        "get_current_time - Get current date and time",
+        "calculate - Perform mathematical calculations",
+        "format_text - Format text (uppercase, lowercase, title, reverse)",
+        "count_words - Count words, characters, and sentences",
+        "create_list - Create formatted lists from text",
+    ),
+}
+
+
 def get_help_info() -> Dict[str, str]:
     """
     Get information about available tools and capabilities.
@@ -140,14 +222,5 @@ def get_help_info() -> Dict[str, str]:
     Returns:
         dict: A dictionary containing help information.
     """
-    return {
-        "status": "success",
-        "message": "I have access to several tools",
-        "available_tools": [
-            "get_current_time - Get current date and time",
-            "calculate - Perform mathematical calculations",
-            "format_text - Format text (uppercase, lowercase, title, reverse)",
-            "count_words - Count words, characters, and sentences",
-            "create_list - Create formatted lists from text",
-        ],
-    }
+    # Shallow copy so callers can't change the shared help info; the tool list is a tuple
+    return dict(_HELP_INFO)
@@ -7,6 +7,7 @@ from slack_bolt import App
 from slack_bolt.adapter.socket_mode import SocketModeHandler
 from slack_sdk import WebClient
 
+from ai.llm_caller import warm_up_runners
 from listeners import register_listeners
 
 # Load environment variables
@@ -25,6 +26,9 @@ app = App(
 # Register Listeners
 register_listeners(app)
 
+# Build the ADK runners before the first request arrives
+warm_up_runners()
+
 # Start Bolt app
 if __name__ == "__main__":
     SocketModeHandler(app, os.environ.get("SLACK_APP_TOKEN")).start()
@@ -7,6 +7,7 @@ from slack_bolt.oauth.oauth_settings import OAuthSettings
 from slack_sdk.oauth.installation_store import FileInstallationStore
 from slack_sdk.oauth.state_store import FileOAuthStateStore
 
+from ai.llm_caller import warm_up_runners
 from listeners import register_listeners
 
 logging.basicConfig(level=logging.DEBUG)
@@ -52,6 +53,9 @@ app = App(
 # Register Listeners
 register_listeners(app)
 
+# Build the ADK runners before the first request arrives
+warm_up_runners()
+
 # Start Bolt app
 if __name__ == "__main__":
     app.start(3000)
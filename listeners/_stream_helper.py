@@ -0,0 +1,140 @@
+import logging
+import queue
+import time
+from typing import Dict, List, Optional
+
+from slack_sdk import WebClient
+from slack_sdk.web.chat_stream import ChatStream
+
+from ai.async_runtime import submit
+from ai.llm_caller import call_llm
+
+logger = logging.getLogger(__name__)
+
+# Minimum number of seconds between two loading message updates
+STATUS_UPDATE_INTERVAL = 0.5
+# Buffered content is appended to the Slack stream once either threshold is hit
+CONTENT_FLUSH_CHARS = 256
+CONTENT_FLUSH_INTERVAL = 0.1
+# The helper does the batching, so ChatStream sends every append right away
+STREAM_BUFFER_SIZE = 1
+
+
+def stream_adk_to_slack(
+    client: WebClient,
+    channel_id: str,
+    thread_ts: str,
+    streamer: ChatStream,
+    messages: List[Dict[str, str]],
+    user_id: str,
+    status: str = "is thinking...",
+):
+    """
+    Stream an ADK response into a Slack thread, showing agent activity as loading messages.
+
+    The ADK call runs on the shared background event loop and only hands events
+    over through a thread-safe queue. Every Slack API call happens here on the
+    listener's thread, so a slow Slack round-trip never stalls other users'
+    streams. Status updates are debounced, and content is batched by size or
+    age so short answers still stream instead of arriving at stream stop.
+
+    Args:
+        client: Slack WebClient for making API calls
+        channel_id: Channel containing the thread
+        thread_ts: Timestamp of the thread, also used as the ADK session ID
+        streamer: Slack chat stream receiving the response content
+        messages: List of message dictionaries with 'role' and 'content' keys
+        user_id: The Slack user ID
+        status: The status shown below the text box while the agent is working
+    """
+    events: "queue.Queue[Optional[Dict[str, str]]]" = queue.Queue()
+
+    async def produce_events():
+        try:
+            async for event in call_llm(
+                messages, user_id=user_id, session_id=thread_ts
+            ):
+                events.put(event)
+        finally:
+            events.put(None)
+
+    future = submit(produce_events())
+
+    last_status_text: Optional[str] = None
+    last_status_ts = float("-inf")
+    pending_status: Optional[str] = None
+    content_buffer: List[str] = []
+    content_buffer_len = 0
+    last_flush_ts = time.monotonic()
+
+    def flush_content():
+        nonlocal content_buffer_len, last_flush_ts
+        if content_buffer:
+            streamer.append(markdown_text="".join(content_buffer))
+            content_buffer.clear()
+            content_buffer_len = 0
+        last_flush_ts = time.monotonic()
+
+    try:
+        while True:
+            # Wake up when a pending status or buffered content is due, even if
+            # no new event arrives
+            deadlines = []
+            if pending_status is not None:
+                deadlines.append(last_status_ts + STATUS_UPDATE_INTERVAL)
+            if content_buffer:
+                deadlines.append(last_flush_ts + CONTENT_FLUSH_INTERVAL)
+            timeout = None
+            if deadlines:
+                timeout = max(0.0, min(deadlines) - time.monotonic())
+            try:
+                event = events.get(timeout=timeout)
+            except queue.Empty:
+                # No new event, but a pending status or buffered content is due
+                pass
+            else:
+                if event is None:
+                    break
+                if event["type"] == "status":
+                    if event["text"] != last_status_text:
+                        pending_status = event["text"]
+                elif event["type"] == "content":
+                    # The answer replaces loading messages once it starts streaming
+                    pending_status = None
+                    # Stream the actual response content
+                    if event["text"]:
+                        content_buffer.append(event["text"])
+                        content_buffer_len += len(event["text"])
+
+            if content_buffer and (
+                content_buffer_len >= CONTENT_FLUSH_CHARS
+                or time.monotonic() - last_flush_ts >= CONTENT_FLUSH_INTERVAL
+            ):
+                flush_content()
+
+            # Send the latest status once the update interval has passed
+            if (
+                pending_status is not None
+                and time.monotonic() - last_status_ts >= STATUS_UPDATE_INTERVAL
+            ):
+                logger.info(f"Setting Slack loading message to: {pending_status}")
+                try:
+                    client.assistant_threads_setStatus(
+                        channel_id=channel_id,
+                        thread_ts=thread_ts,
+                        status=status,
+                        loading_messages=[pending_status],
+                    )
+                except Exception as e:
+                    logger.warning(f"Failed to update Slack loading message: {e}")
+                last_status_text = pending_status
+                last_status_ts = time.monotonic()
+                pending_status = None
+
+        flush_content()
+
+        # Surface any error raised while calling the agents
+        future.result()
+    finally:
+        # Stop the agent run if streaming to Slack failed part way through
+        future.cancel()
@@ -1,12 +1,10 @@
-import asyncio
 from logging import Logger
 from typing import Dict, List
 
 from slack_bolt import BoltContext, Say, SetStatus
 from slack_sdk import WebClient
 
-from ai.llm_caller import call_llm
-
+from .._stream_helper import STREAM_BUFFER_SIZE, stream_adk_to_slack
 from ..views.feedback_block import create_feedback_block
 
 
@@ -38,22 +36,14 @@ def message(
         # Set initial status - will be updated dynamically based on agent activity
         set_status(status="is thinking...")
 
-        replies = client.conversations_replies(
-            channel=context.channel_id,
-            ts=context.thread_ts,
-            oldest=context.thread_ts,
-            limit=10,
-        )
-        messages_in_thread: List[Dict[str, str]] = []
-        for message in replies["messages"]:
-            role = "user" if message.get("bot_id") is None else "assistant"
-            messages_in_thread.append({"role": role, "content": message["text"]})
-
-        # Create event loop for async call
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
+        # call_llm only sends the latest message and the ADK session keyed on
+        # thread_ts carries the earlier context, so no history fetch is needed
+        messages_in_thread: List[Dict[str, str]] = [
+            {"role": "user", "content": payload.get("text", "")}
+        ]
 
         streamer = client.chat_stream(
+            buffer_size=STREAM_BUFFER_SIZE,
             channel=channel_id,
             recipient_team_id=team_id,
             recipient_user_id=user_id,
@@ -61,29 +51,15 @@ def message(
         )
 
         # Stream ADK response with dynamic status updates
-        async def stream_response():
-            async for event in call_llm(
-                messages_in_thread, user_id=user_id, session_id=thread_ts
-            ):
-                if event["type"] == "status":
-                    # Update the loading message with real-time agent activity
-                    logger.info(f"Setting Slack loading message to: {event['text']}")
-                    # Use client API directly to access loading_messages parameter
-                    client.assistant_threads_setStatus(
-                        channel_id=channel_id,
-                        thread_ts=thread_ts,
-                        status="is thinking...",  # The status below text box which typically shows "is typing..." for other users
-                        loading_messages=[
-                            event["text"]
-                        ],  # The text that shows next to the app name shimmer. Here you can put custom text from you Agent events.
-                    )
-                elif event["type"] == "content":
-                    # Stream the actual response content
-                    if event["text"]:
-                        streamer.append(markdown_text=event["text"])
-
-        loop.run_until_complete(stream_response())
-        loop.close()
+        stream_adk_to_slack(
+            client,
+            channel_id,
+            thread_ts,
+            streamer,
+            messages_in_thread,
+            user_id,
+            status="is thinking...",
+        )
 
         feedback_block = create_feedback_block()
         streamer.stop(blocks=feedback_block)
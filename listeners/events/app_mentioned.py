@@ -1,10 +1,9 @@
-import asyncio
 from logging import Logger
 
 from slack_bolt import Say
 from slack_sdk import WebClient
 
-from ai.llm_caller import call_llm
+from .._stream_helper import STREAM_BUFFER_SIZE, stream_adk_to_slack
 from ..views.feedback_block import create_feedback_block
 
 
@@ -35,11 +34,8 @@ def app_mentioned_callback(client: WebClient, event: dict, logger: Logger, say:
             loading_messages=["Starting to process your request..."],
         )
 
-        # Create event loop for async call
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-
         streamer = client.chat_stream(
+            buffer_size=STREAM_BUFFER_SIZE,
             channel=channel_id,
             recipient_team_id=team_id,
             recipient_user_id=user_id,
@@ -47,29 +43,15 @@ def app_mentioned_callback(client: WebClient, event: dict, logger: Logger, say:
         )
 
         # Stream ADK response with dynamic status updates
-        async def stream_response():
-            async for event in call_llm(
-                [{"role": "user", "content": text}],
-                user_id=user_id,
-                session_id=thread_ts,
-            ):
-                if event["type"] == "status":
-                    # Update the loading message with real-time agent activity
-                    # Keep generic status but show detailed info in loading_messages
-                    logger.info(f"Setting Slack loading message to: {event['text']}")
-                    client.assistant_threads_setStatus(
-                        channel_id=channel_id,
-                        thread_ts=thread_ts,
-                        status="is working...",  # Generic status
-                        loading_messages=[event["text"]],  # Specific detail
-                    )
-                elif event["type"] == "content":
-                    # Stream the actual response content
-                    if event["text"]:
-                        streamer.append(markdown_text=event["text"])
-
-        loop.run_until_complete(stream_response())
-        loop.close()
+        stream_adk_to_slack(
+            client,
+            channel_id,
+            thread_ts,
+            streamer,
+            [{"role": "user", "content": text}],
+            user_id,
+            status="is working...",
+        )
 
         feedback_block = create_feedback_block()
         streamer.stop(blocks=feedback_block)
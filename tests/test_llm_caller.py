@@ -0,0 +1,46 @@
+import pytest
+
+from ai import llm_caller
+from ai.llm_caller import _record_route, clear_route_cache, normalize_query
+
+
+@pytest.fixture(autouse=True)
+def empty_route_cache():
+    clear_route_cache()
+    yield
+    clear_route_cache()
+
+
+@pytest.mark.parametrize(
+    "query, expected",
+    [
+        ("What time is it?", "what time is it?"),
+        ("  Calculate   2 + 2 ", "calculate 2 + 2"),
+        ("Format\tthis\ntext", "format this text"),
+        ("", ""),
+    ],
+)
+def test_normalize_query(query, expected):
+    assert normalize_query(query) == expected
+
+
+def test_record_route_evicts_least_recently_used(monkeypatch):
+    monkeypatch.setattr(llm_caller, "_ROUTE_CACHE_MAXSIZE", 2)
+
+    _record_route("calculate 2 + 2", "MathAgent")
+    _record_route("what time is it?", "InfoAgent")
+    # Recording an existing route again makes it the most recently used
+    _record_route("calculate 2 + 2", "MathAgent")
+    _record_route("count words", "TextAgent")
+
+    assert dict(llm_caller._route_cache) == {
+        "calculate 2 + 2": "MathAgent",
+        "count words": "TextAgent",
+    }
+
+
+def test_record_route_overwrites_existing_route():
+    _record_route("format hi", "InfoAgent")
+    _record_route("format hi", "TextAgent")
+
+    assert dict(llm_caller._route_cache) == {"format hi": "TextAgent"}
@@ -0,0 +1,64 @@
+import pytest
+
+from ai.tools import _parse_expression, calculate
+
+
+@pytest.mark.parametrize(
+    "expression, expected",
+    [
+        ("2 + 2", 4),
+        ("10 * 5 - 3", 47),
+        ("(3 * 4) / 2", 6.0),
+        ("7 // 2", 3),
+        ("2 ** 10", 1024),
+        ("-5 + 3", -2),
+        ("-(2 + 3)", -5),
+        ("+4", 4),
+    ],
+)
+def test_calculate_arithmetic(expression, expected):
+    result = calculate(expression)
+
+    assert result == {"status": "success", "expression": expression, "result": expected}
+
+
+def test_calculate_fractional_power():
+    result = calculate("2**0.5")
+
+    assert result["status"] == "success"
+    assert result["result"] == pytest.approx(1.41421356)
+
+
+@pytest.mark.parametrize("expression", ["abs(1)", "x", "(1).real", "__import__('os')"])
+def test_calculate_rejects_names_calls_and_attributes(expression):
+    result = calculate(expression)
+
+    assert result["status"] == "error"
+    assert "Invalid characters" in result["message"]
+
+
+@pytest.mark.parametrize("expression", ["abs(1)", "x", "(1).real", "'a' * 3"])
+def test_parse_expression_whitelist(expression):
+    with pytest.raises(ValueError):
+        _parse_expression(expression)
+
+
+def test_calculate_division_by_zero():
+    result = calculate("1/0")
+
+    assert result["status"] == "error"
+    assert "division by zero" in result["message"]
+
+
+@pytest.mark.parametrize("expression", ["9**9**8", "(2**9999)", "(2**9000)**2"])
+def test_calculate_rejects_huge_powers(expression):
+    result = calculate(expression)
+
+    assert result["status"] == "error"
+    assert "too large" in result["message"]
+
+
+def test_calculate_deep_nesting_returns_error():
+    result = calculate("-" * 100_000 + "1")
+
+    assert result["status"] == "error"